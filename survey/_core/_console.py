@@ -59,16 +59,31 @@ class Console:
         def print(re):
             self._screen.print(sketch, re)
 
+        dirty = False
+
         def callback(name, info):
+            nonlocal dirty
             try:
                 invoke(name, info)
             except SkipDraw:
                 return
+            dirty = True
+
+        # draw once all received input (eg: a paste) is consumed
+        def flush():
+            nonlocal dirty
+            if not dirty:
+                return
+            dirty = False
             print(True)
 
         print(False)
 
-        self._handle.start(callback)
+        # a burst can end in termination or an error, leaving a draw still owed
+        try:
+            self._handle.start(callback, flush)
+        finally:
+            flush()
 
     def start(self,
               sketch: _screen._type_Screen_draw_sketch, 
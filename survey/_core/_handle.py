@@ -17,6 +17,7 @@ class Terminate(Exception):
 
 
 _type_Handle_start_invoke = typing.Callable[[str, _ansi._type_parse_return], None]
+_type_Handle_start_flush  = _source._type_Source_init_flush
 
     
 class Handle:
@@ -37,9 +38,9 @@ class Handle:
 
         return self._intel
 
-    def _start(self, invoke):
+    def _start(self, invoke, flush):
 
-        source = _source.Source(invoke, self._intel)
+        source = _source.Source(invoke, self._intel, flush)
 
         try:
             source.listen()
@@ -47,7 +48,8 @@ class Handle:
             pass
 
     def start(self,
-              invoke: _type_Handle_start_invoke):
+              invoke: _type_Handle_start_invoke,
+              flush : _type_Handle_start_flush = None):
         
         """
         Start the invokation loop.
@@ -56,6 +58,8 @@ class Handle:
 
         :param invoke:
             Used as :paramref:`.Source.callback` callback.
+        :param flush:
+            Used as :paramref:`.Source.flush` callback.
         """
 
-        self._start(invoke)
\ No newline at end of file
+        self._start(invoke, flush)
\ No newline at end of file
@@ -30,6 +30,15 @@ class Intel:
     def io(self):
 
         return self._io
+    
+    @property
+    def pending(self):
+
+        """
+        Whether already received input is waiting to be read.
+        """
+
+        return bool(self._rune_buffer or self._code_buffer)
 
     def _fill_text(self):
 
@@ -55,6 +55,7 @@ class _EmptyRead(Exception):
 
 
 _type_Source_init_callback = typing.Callable[[Event, _ansi._type_parse_return], None]
+_type_Source_init_flush    = typing.Union[typing.Callable[[], None], None]
 
 
 class Source:
@@ -66,16 +67,20 @@ class Source:
         Called with ``(name, info)`` upon receiving and translating.
     :param intel:
         Used for receiving from input.
+    :param flush:
+        Called with no arguments after a read once no received input is left pending.
     """
 
-    __slots__ = ('_callback', '_intel', '_lock')
+    __slots__ = ('_callback', '_intel', '_flush', '_lock')
 
     def __init__(self, 
                  callback: _type_Source_init_callback, 
-                 intel   : _intel.Intel):
+                 intel   : _intel.Intel,
+                 flush   : _type_Source_init_flush = None):
 
         self._callback = callback
         self._intel = intel
+        self._flush = flush
 
         self._lock = threading.RLock()
 
@@ -145,6 +150,11 @@ class Source:
 
         self._process(info)
 
+        if self._flush is None or self._intel.pending:
+            return
+        
+        self._flush()
+
     def _listen(self):
 
         while True:
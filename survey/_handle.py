@@ -35,6 +35,7 @@ class Abort(Exception):
 
 _type_Handle_init_unsafe   = bool
 _type_Handle_init_callback = typing.Callable[[typing.Tuple[EventType, _core.Event], _core._type_ansi_parse_return], None]
+_type_Handle_init_controls = typing.Union[typing.Dict[_core.Event, _controls.Control], None]
 
 _type_Handle_add_control   = _controls.Control
 
@@ -50,6 +51,8 @@ class Handle:
         Whether :exc:`KeyError` should be surfaced when an invoke is missing.
     :param callback:
         Called before and after invokation with :attr:`.Event.enter.` and :attr:`.Event.leave` prepended in the arguments respectively.
+    :param controls:
+        A ``{event: control}`` table to start with. It is copied, so later additions do not affect it.
     """
 
     __slots__ = ('_args', '_unsafe', '_controls', '_callback')
@@ -57,13 +60,23 @@ class Handle:
     def __init__(self, 
                  *args,
                  unsafe  : _type_Handle_init_unsafe   = False, 
-                 callback: _type_Handle_init_callback = None):
+                 callback: _type_Handle_init_callback = None,
+                 controls: _type_Handle_init_controls = None):
 
         self._args = args
         self._unsafe = unsafe
-        self._controls = {}
+        self._controls = {} if controls is None else dict(controls)
         self._callback = callback or _helpers.noop
 
+    @property
+    def events(self) -> typing.KeysView[_core.Event]:
+
+        """
+        A live view of the events that have a control.
+        """
+
+        return self._controls.keys()
+
     def add(self, 
             control: _type_Handle_add_control):
 
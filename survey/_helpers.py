@@ -192,6 +192,19 @@ def chain_functions(*functions):
 
     functions = tuple(filter(callable, functions))
 
+    if not functions:
+        return noop
+
+    if len(functions) == 1:
+        return functions[0]
+
+    if len(functions) == 2:
+        function_0, function_1 = functions
+        def function(*args, **kwargs):
+            function_0(*args, **kwargs)
+            function_1(*args, **kwargs)
+        return function
+
     def function(*args, **kwargs):
         for function in functions:
             function(*args, **kwargs)
@@ -234,6 +247,10 @@ def split_line(value):
 
 def split_lines(value, *args, **kwargs):
 
+    # plain single lines have nothing to split
+    if not _constants.linesep in value and not '\x1b' in value:
+        return [list(value)]
+
     values = value.split(_constants.linesep)
 
     get = lambda value: split_line(value, *args, **kwargs)
@@ -446,29 +463,38 @@ def get_function_args_names(function):
     return tuple(parameters)
 
 
-def get_function_args_default(function, name):
+@functools.lru_cache()
+def get_function_args_defaults(function):
 
     parameters = get_function_parameters(function)
 
-    parameter = parameters[name]
-
-    default = parameter.default
+    defaults = {name: parameter.default for name, parameter in parameters.items() if not parameter.default is inspect.Parameter.empty}
 
-    if default is inspect.Parameter.empty:
-        raise ValueError(f'parameter "{name}" of {function} has no default')
+    return defaults
 
-    return default
 
+def get_function_args_default(function, name):
 
-def get_function_arg_safe(function, name, store, pop = False):
-
-    getter = store.pop if pop else store.__getitem__
+    defaults = get_function_args_defaults(function)
 
     try:
-        return getter(name)
+        return defaults[name]
     except KeyError:
         pass
 
+    parameters = get_function_parameters(function)
+
+    if not name in parameters:
+        raise KeyError(name)
+
+    raise ValueError(f'parameter "{name}" of {function} has no default')
+
+
+def get_function_arg_safe(function, name, store, pop = False):
+
+    if name in store:
+        return store.pop(name) if pop else store[name]
+
     return get_function_args_default(function, name)
 
 
@@ -164,7 +164,7 @@ class Text(Mutate):
     
     def _get_state(self):
 
-        lines = copy.deepcopy(self._lines)
+        lines = [list(line) for line in self._lines]
 
         cursor = self._cursor.get_state()
 
@@ -555,7 +555,7 @@ class Mesh(Mutate):
         cursor = self._cursor.get_state()
 
         search = self._search_mutate.get_state()
-        vision = copy.deepcopy(self._vision)
+        vision = dict(self._vision)
 
         return self._State(
             tiles = tiles, 
@@ -118,7 +118,7 @@ def _get(multi_maybe: _type_get_multi_maybe,
         head_funnel_leave_entry = _funnel_text_linesep(multi_force, False)
         head_funnel_leave_group.append(head_funnel_leave_entry)
     head_funnel_leave = _helpers.chain_functions(*head_funnel_leave_group)
-    head_visual = _visuals.Mesh.link(head_visual_tiles, [0, 0], funnel_enter = head_funnel_enter, funnel_leave = head_funnel_leave)
+    head_visual = _visuals.Mesh.link(head_visual_tiles, [0, 0], funnel_enter = head_funnel_enter, funnel_leave = head_funnel_leave, cache = True)
 
     body_visual = _visuals.Text(body_get)
 
@@ -128,7 +128,7 @@ def _get(multi_maybe: _type_get_multi_maybe,
     foot_funnel_leave_entry = _funnel_text_linesep(False, True)
     foot_funnel_leave_group.append(foot_funnel_leave_entry)
     foot_funnel_leave = _helpers.chain_functions(*foot_funnel_leave_group)
-    foot_visual = _visuals.Mesh.link(foot_visual_tiles, [0, 0], funnel_enter = foot_funnel_enter, funnel_leave = foot_funnel_leave)
+    foot_visual = _visuals.Mesh.link(foot_visual_tiles, [0, 0], funnel_enter = foot_funnel_enter, funnel_leave = foot_funnel_leave, cache = True)
 
     head_visual_get = head_visual.get
     body_visual_get = body_visual.get
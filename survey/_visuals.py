@@ -9,7 +9,8 @@ Most accept data structured in similar ways to how it is used in :class`~.mutate
 import typing
 import abc
 import copy
-import math
+import itertools
+import operator
 
 from . import _core
 
@@ -17,9 +18,18 @@ from . import _core
 __all__ = ('Visual', 'Text', 'Mesh', 'Line')
 
 
+def _clone_text(lines, point):
+
+    lines = [list(line) for line in lines]
+    point = list(point)
+
+    return (lines, point)
+
+
 _type_Visual_init_get          = typing.Callable[[bool, bool], typing.Tuple[typing.Any]]
 _type_Visual_init_funnel_enter = typing.Union[typing.Callable[[typing.Any], None], None]
 _type_Visual_init_funnel_leave = typing.Union[typing.Callable[[_core._type_Render_draw_lines, _core._type_Render_draw_point], None], None]
+_type_Visual_init_cache        = bool
 
 _type_Visual_get_enter         = bool
 _type_Visual_get_leave         = bool
@@ -52,10 +62,18 @@ class Visual(abc.ABC):
         self._funnel_enter = funnel_enter
         self._funnel_leave = funnel_leave
 
+    def _clone(self, *args):
+
+        return copy.deepcopy(args)
+
     @abc.abstractmethod
     def _format(self, *args):
 
         return NotImplemented
+    
+    def _transform(self, assets):
+
+        return self._format(*assets)
 
     def get(self, 
             enter: _type_Visual_get_enter = True, 
@@ -73,17 +91,63 @@ class Visual(abc.ABC):
             The final lines and point.
         """
 
+        funnel_enter = self._funnel_enter
+        funnel_leave = self._funnel_leave
+
         assets = self._get(enter, leave)
 
-        assets = copy.deepcopy(assets)
+        assets = self._clone(*assets)
+
+        if enter and not funnel_enter is None:
+            funnel_enter(*assets)
+
+        lines, point = self._transform(assets)
+
+        if leave and not funnel_leave is None:
+            funnel_leave(lines, point)
+
+        return (lines, point)
+
+
+class _CacheVisual(Visual):
+
+    """
+    Base class for visuals that can reuse their last transformation.
+
+    :param cache:
+        Whether to reuse the last transformation when the (funneled) data has not changed since.
+    """
+
+    __slots__ = ('_cache', '_cache_entry')
+
+    def __init__(self, 
+                 get         : _type_Visual_init_get, 
+                 funnel_enter: _type_Visual_init_funnel_enter = None,
+                 funnel_leave: _type_Visual_init_funnel_leave = None,
+                 cache       : _type_Visual_init_cache        = False):
+
+        super().__init__(get, funnel_enter, funnel_leave)
+
+        self._cache = cache
+        self._cache_entry = None
+
+    def _transform(self, assets):
+
+        if not self._cache:
+            return self._format(*assets)
 
-        if enter and not self._funnel_enter is None:
-            self._funnel_enter(*assets)
+        entry = self._cache_entry
 
-        lines, point = self._format(*assets)
+        # assets are already a private clone, so they are kept as-is for the next comparison
+        if entry is None or not entry[0] == assets:
+            lines, point = self._format(*assets)
+            entry = self._cache_entry = (assets, lines, point)
 
-        if leave and not self._funnel_leave is None:
-            self._funnel_leave(lines, point)
+        _, lines, point = entry
+
+        # hand out copies, leave funnels mutate lines in-place
+        lines = [line[:] for line in lines]
+        point = list(point)
 
         return (lines, point)
 
@@ -133,10 +197,35 @@ class Text(Visual):
 
         return cls(get, *args, **kwargs)
 
+    def _clone(self, lines, point):
+
+        return _clone_text(lines, point)
+
     def _format(self, lines, point):
 
         return (lines, point)
     
+    def get(self, 
+            enter: _type_Visual_get_enter = True, 
+            leave: _type_Visual_get_leave = True) -> _type_Visual_get_return:
+
+        """
+        Same as :meth:`.Visual.get`, skipping the formatting step since it changes nothing.
+        """
+
+        funnel_enter = self._funnel_enter
+        funnel_leave = self._funnel_leave
+
+        lines, point = self._clone(*self._get(enter, leave))
+
+        if enter and not funnel_enter is None:
+            funnel_enter(lines, point)
+
+        if leave and not funnel_leave is None:
+            funnel_leave(lines, point)
+
+        return (lines, point)
+    
 
 _type_Mesh_link_tiles        = typing.Dict[typing.Tuple[int, int], typing.Tuple[_type_Text_link_lines, _type_Text_link_point]]
 _type_Mesh_link_point        = typing.List[int]
@@ -144,9 +233,13 @@ _type_Mesh_link_point        = typing.List[int]
 _type_Mesh_init_get          = typing.Callable[[bool, bool], typing.Tuple[_type_Mesh_link_tiles, _type_Mesh_link_point]]
 _type_Mesh_init_funnel_enter = typing.Union[typing.Callable[[_type_Mesh_link_tiles, _type_Mesh_link_point], None], None]
 _type_Mesh_init_funnel_leave = _type_Visual_init_funnel_leave
+_type_Mesh_init_cache        = _type_Visual_init_cache
+
+
+_Mesh_format_entry_spot_x = operator.itemgetter(0)
 
 
-class Mesh(Visual):
+class Mesh(_CacheVisual):
 
     """
     Transforms mesh tiles and point into lines and cursor point.
@@ -157,6 +250,8 @@ class Mesh(Visual):
         Used for mutating ``(tiles, point)`` in-place before turning into ``(lines, point)``.
     :param funnel_leave:
         Used for mutating the resulting ``(lines, point)`` in-place after transforming ``(tiles, point)``.
+    :param cache:
+        Whether to reuse the last ``(lines, point)`` when the (funneled) ``(tiles, point)`` have not changed since.
 
     - ``tiles`` is ``{spot: tile, ...}``
     - ``spot`` is ``(y, x)``
@@ -168,9 +263,10 @@ class Mesh(Visual):
     def __init__(self, 
                  get         : _type_Mesh_init_get, 
                  funnel_enter: _type_Mesh_init_funnel_enter = None,
-                 funnel_leave: _type_Mesh_init_funnel_leave = None):
+                 funnel_leave: _type_Mesh_init_funnel_leave = None,
+                 cache       : _type_Mesh_init_cache        = False):
         
-        super().__init__(get, funnel_enter, funnel_leave)
+        super().__init__(get, funnel_enter, funnel_leave, cache)
 
     @classmethod
     def link(cls, 
@@ -186,54 +282,67 @@ class Mesh(Visual):
         - ``get`` is like :meth:`.get` and returns ``(lines, point)``
         """
 
-        def get(*args):
-            dyn_tiles = {spot: get(*args) for spot, get in tiles.items()}
-            dyn_point = copy.deepcopy(point)
+        def get(enter, leave):
+            dyn_tiles = {spot: tile_get(enter, leave) for spot, tile_get in tiles.items()}
+            dyn_point = point[:]
             return (dyn_tiles, dyn_point)
         
         return cls(get, *args, **kwargs)
 
+    def _clone(self, tiles, point):
+
+        tiles = {spot: _clone_text(*tile) for spot, tile in tiles.items()}
+        point = list(point)
+
+        return (tiles, point)
+
     def _format(self, tiles, point):
 
-        spots = tiles.keys()
+        buckets = {}
+        for (spot_y, spot_x), tile in tiles.items():
+            try:
+                bucket = buckets[spot_y]
+            except KeyError:
+                bucket = buckets[spot_y] = []
+            bucket.append((spot_x, tile))
 
         main_y, main_x = point
 
-        done_lines = []
+        memo_groups = []
         memo_lines = []
-        memo_y = - math.inf
 
         fin_y = 0
         fin_x = 0
 
-        for spot in sorted(spots):
-            spot_y, spot_x = spot
-            tile_lines, tile_point = tiles[spot]
-            tile_point_y, tile_point_x = tile_point
-            if not spot_y == memo_y:
-                if spot_y <= main_y:
-                    fin_y += len(memo_lines)
-                done_lines[0:0] = memo_lines
-                memo_y = spot_y
-                memo_lines.clear()
-            if spot_y == main_y and spot_x == main_x:
-                fin_y += len(tile_lines) - tile_point_y
-                try:
-                    memo_line = memo_lines[tile_point_y]
-                except IndexError:
-                    ext_x = 0
-                else:
-                    ext_x = len(memo_line)
-                fin_x = ext_x + tile_point_x
-            for tile_line_index, tile_line in enumerate(tile_lines):
-                try:
-                    memo_line = memo_lines[tile_line_index]
-                except IndexError:
-                    memo_line = []
-                    memo_lines.append(memo_line)
-                memo_line.extend(tile_line)
-
-        done_lines[0:0] = memo_lines
+        for spot_y in sorted(buckets):
+            if spot_y <= main_y:
+                fin_y += len(memo_lines)
+            group = buckets[spot_y]
+            group.sort(key = _Mesh_format_entry_spot_x)
+            memo_sizes = []
+            for spot_x, (tile_lines, tile_point) in group:
+                for tile_line_index, tile_line in enumerate(tile_lines):
+                    if tile_line_index < len(memo_sizes):
+                        memo_sizes[tile_line_index] += len(tile_line)
+                    else:
+                        memo_sizes.append(len(tile_line))
+            memo_lines = [[None] * memo_size for memo_size in memo_sizes]
+            memo_groups.append(memo_lines)
+            memo_edges = [0] * len(memo_sizes)
+            main_row = spot_y == main_y
+            for spot_x, (tile_lines, tile_point) in group:
+                if main_row and spot_x == main_x:
+                    tile_point_y, tile_point_x = tile_point
+                    fin_y += len(tile_lines) - tile_point_y
+                    ext_x = memo_edges[tile_point_y] if tile_point_y < len(memo_edges) else 0
+                    fin_x = ext_x + tile_point_x
+                for tile_line_index, tile_line in enumerate(tile_lines):
+                    memo_edge = memo_edges[tile_line_index]
+                    memo_edges[tile_line_index] = next_edge = memo_edge + len(tile_line)
+                    memo_lines[tile_line_index][memo_edge:next_edge] = tile_line
+
+        # groups are gathered bottom-up, so they are laid out in reverse
+        done_lines = list(itertools.chain.from_iterable(reversed(memo_groups)))
 
         fin_y = len(done_lines) - fin_y
 
@@ -248,9 +357,23 @@ _type_Line_link_point        = typing.List[int]
 _type_Line_init_get          = typing.Callable[[bool, bool], typing.Tuple[_type_Line_link_tiles, _type_Line_link_point]]
 _type_Line_init_funnel_enter = typing.Union[typing.Callable[[_type_Line_link_tiles, _type_Line_link_point], None], None]
 _type_Line_init_funnel_leave = _type_Visual_init_funnel_leave
+_type_Line_init_cache        = _type_Visual_init_cache
 
 
-class Line(Visual):
+def _Line_format_merge(lines, tile_lines):
+
+    if not tile_lines:
+        return
+
+    lines[- 1].extend(tile_lines[0])
+
+    if len(tile_lines) > 1:
+        lines.extend(tile_lines[1:- 1])
+        # the last line is extended by later tiles, so it cannot be the tile's own
+        lines.append(tile_lines[- 1][:])
+
+
+class Line(_CacheVisual):
 
     """
     Transforms a list of tiles and point into lines and cursor point.
@@ -261,6 +384,8 @@ class Line(Visual):
         Used for mutating ``(tiles, point)`` in-place before turning into ``(lines, point)``.
     :param funnel_leave:
         Used for mutating the resulting ``(lines, point)`` in-place after transforming ``(tiles, point)``.
+    :param cache:
+        Whether to reuse the last ``(lines, point)`` when the (funneled) ``(tiles, point)`` have not changed since.
 
     - ``tiles`` is ``[get, ...]``
     - ``get`` is like :meth:`.get` and return ``(lines, point)``
@@ -271,9 +396,10 @@ class Line(Visual):
     def __init__(self, 
                  get         : _type_Line_init_get, 
                  funnel_enter: _type_Line_init_funnel_enter = None,
-                 funnel_leave: _type_Line_init_funnel_leave = None):
+                 funnel_leave: _type_Line_init_funnel_leave = None,
+                 cache       : _type_Line_init_cache        = False):
         
-        super().__init__(get, funnel_enter, funnel_leave)
+        super().__init__(get, funnel_enter, funnel_leave, cache)
 
     @classmethod
     def link(cls, 
@@ -288,38 +414,50 @@ class Line(Visual):
         - ``get`` is like :meth:`.get`
         """
 
-        def get(*args):
-            dyn_tiles = [get(*args) for get in tiles]
-            dyn_point = copy.deepcopy(point)
+        def get(enter, leave):
+            dyn_tiles = [tile_get(enter, leave) for tile_get in tiles]
+            dyn_point = point[:]
             return (dyn_tiles, dyn_point)
         
         return cls(get, *args, **kwargs)
 
+    def _clone(self, tiles, point):
+
+        tiles = [_clone_text(*tile) for tile in tiles]
+        point = list(point)
+
+        return (tiles, point)
+
     def _format(self, tiles, tiles_point):
 
         tiles_index = tiles_point[0]
 
+        if tiles_index == 0 and len(tiles) == 1:
+            tile_lines, tile_point = tiles[0]
+            lines = tile_lines or [[]]
+            point = list(tile_point)
+            return (lines, point)
+
         fin_y = 0
         fin_x = 0
 
         lines = [[]]
-        for tile_index, tile in enumerate(tiles):
-            tile_lines, tile_point = tile
-            if tile_index < tiles_index:
-                fin_y += len(tile_lines) - 1
-            elif tile_index == tiles_index:
-                fin_y += tile_point[0]
-                fin_x = tile_point[1]
-                if not fin_y:
-                    fin_x += len(lines[fin_y])
-            try:
-                line = tile_lines.pop(0)
-            except IndexError:
-                continue
-            lines[- 1].extend(line)
-            lines.extend(tile_lines)
+
+        for tile_lines, tile_point in tiles[:tiles_index]:
+            fin_y += len(tile_lines) - 1
+            _Line_format_merge(lines, tile_lines)
+
+        if tiles_index < len(tiles):
+            tile_lines, tile_point = tiles[tiles_index]
+            fin_y += tile_point[0]
+            fin_x = tile_point[1]
+            if not fin_y:
+                fin_x += len(lines[fin_y])
+            _Line_format_merge(lines, tile_lines)
+
+        for tile_lines, tile_point in tiles[tiles_index + 1:]:
+            _Line_format_merge(lines, tile_lines)
 
         point = [fin_y, fin_x]
 
         return (lines, point)
-
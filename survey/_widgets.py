@@ -4,11 +4,10 @@ Combinations of :class:`~.mutates.Mutate`\\s, :class:`~.visuals.Visual`\\s and
 :class:`~.handle.Handle` to create interactive units that can be resolved into expected values. 
 """
 
-import contextvars
 import datetime
 import functools
 import itertools
-import math
+import re
 import typing
 
 from . import (_colors, _controls, _core, _funnels, _handle, _helpers,
@@ -49,6 +48,9 @@ _type_Widget_invoke_event = _core.Event
 _type_Widget_invoke_info  = _core._type_ansi_parse_return
 
 
+_Widget_product_mark = object()
+
+
 class Widget:
 
     """
@@ -66,9 +68,7 @@ class Widget:
         Used with ``(result)`` upon submission, forbidden by raising :exc:`.Abort`.
     """
 
-    _product_mark = object()
-
-    __slots__ = ('_mutate', '_handle', '_visual', '_delegate', '_validate', '_escapable', '_product')
+    __slots__ = ('_mutate', '_handle', '_handle_events', '_visual', '_delegate', '_validate', '_escapable', '_product')
 
     def __init_subclass__(cls, controls = (), **kwargs):
 
@@ -76,6 +76,10 @@ class Widget:
         
         cls._controls = (*pre_controls, *controls)
 
+        cls._controls_table = {control.event: control for control in cls._controls}
+
+        cls._super_cls = cls.__mro__[1]
+
         super().__init_subclass__(**kwargs)
 
     def __init__(self, 
@@ -88,16 +92,14 @@ class Widget:
         
         self._delegate = delegate
         self._validate = validate
-        self._product = self._product_mark
+        self._product = _Widget_product_mark
 
         self._mutate = mutate
 
-        handle = _handle.Handle(mutate, callback = callback)
-
-        for control in self._controls:
-            handle.add(control)
+        handle = _handle.Handle(mutate, callback = callback, controls = self._controls_table)
 
         self._handle = handle
+        self._handle_events = handle.events
         self._visual = visual
 
         self._escapable = escapable
@@ -119,7 +121,7 @@ class Widget:
 
         value = self._product
 
-        if value is self._product_mark:
+        if value is _Widget_product_mark:
             value = self._produce()
 
         return value
@@ -141,17 +143,20 @@ class Widget:
 
         value = self._product
 
-        if value is self._product_mark:
+        if value is _Widget_product_mark:
             value = self._product = self._produce()
 
         try:
             validate(value)
         except Abort:
-            self._product = self._product_mark
+            self._product = _Widget_product_mark
             raise
 
     def _invoke(self, event, *args, **kwargs):
 
+        if not event in self._handle_events:
+            return
+
         if self._delegate and not self._delegate(event):
             return
 
@@ -212,16 +217,25 @@ def _start_variant_parse(parse, value):
     return value
 
 
+_start_get_actor_contextual_mark = object()
+
+
 _type_start_get_actor_contextual_parse   = bool
-_type_start_get_actor_contextual_context = contextvars.ContextVar
+_type_start_get_actor_contextual_context = typing.List[typing.Any]
 
 
 def _start_get_actor_contextual(parse  : _type_start_get_actor_contextual_parse,
                                 context: _type_start_get_actor_contextual_context):
 
+    memo_value = memo_state = _start_get_actor_contextual_mark
+
     def wrapper(*args, **kwargs):
-        value = context.get()
-        return _start_variant_parse(parse, value)
+        nonlocal memo_value, memo_state
+        value = context[0]
+        if not value is memo_value:
+            memo_state = _start_variant_parse(parse, value)
+            memo_value = value
+        return memo_state
     
     return wrapper
 
@@ -233,11 +247,10 @@ _type_start_start_get_actor_static_value = typing.Union[str, typing.List[typing.
 def _start_get_actor_static(parse: _type_start_start_get_actor_static_parse, 
                             value: _type_start_start_get_actor_static_value):
 
-    context = contextvars.ContextVar('state')
+    value = _start_variant_parse(parse, value)
 
-    context.set(value)
-
-    wrapper = _start_get_actor_contextual(parse, context)
+    def wrapper(*args, **kwargs):
+        return value
 
     return wrapper
 
@@ -249,16 +262,19 @@ _type_start_start_get_actor_dynamic_fetch = typing.Callable[[typing.Any], typing
 def _start_get_actor_dynamic(parse: _type_start_start_get_actor_dynamic_parse, 
                              fetch: _type_start_start_get_actor_dynamic_fetch):
 
-    context = contextvars.ContextVar('state')
+    context = [None]
 
     def updater(*args, **kwargs):
-        context.set(fetch(*args, **kwargs))
+        context[0] = fetch(*args, **kwargs)
     
     wrapper = _start_get_actor_contextual(parse, context)
 
     return wrapper, updater
 
 
+_start_get_actor_dichotomic_static_types = (str, list, tuple)
+
+
 _type_start_get_actor_dichotomic_parse = _type_start_get_actor_contextual_parse
 _type_start_get_actor_dichotomic_value = typing.Union[_type_start_start_get_actor_static_value, _type_start_start_get_actor_dynamic_fetch]
 
@@ -266,15 +282,31 @@ _type_start_get_actor_dichotomic_value = typing.Union[_type_start_start_get_acto
 def _start_get_actor_dichotomic(parse: _type_start_get_actor_dichotomic_parse, 
                                 value: _type_start_get_actor_dichotomic_value):
 
-    if callable(value):
-        wrapper, updater = _start_get_actor_dynamic(parse, value)
-    else:
+    if isinstance(value, _start_get_actor_dichotomic_static_types):
         wrapper = _start_get_actor_static(parse, value)
         updater = _helpers.noop
+    else:
+        wrapper, updater = _start_get_actor_dynamic(parse, value)
 
     return wrapper, updater
 
 
+@functools.lru_cache(maxsize = 256)
+def _start_get_show_actor(show, mark, mark_color):
+
+    if show is None:
+        show = ''
+
+    if not mark is None:
+        if mark_color:
+            mark = _helpers.paint_text(mark_color, mark)
+        show = mark + show
+
+    show_get = _start_get_actor_static(True, show)
+
+    return (show, show_get)
+
+
 _start_warn_reset_lines = [[]]
 
 _type_start_multi_pre  = _stage._type_get_multi_maybe
@@ -333,15 +365,7 @@ def _start(multi_pre : _type_start_multi_pre,
         Called upon successful submission with ``(widget, result)``. Should return a class:`str` that is used as a response.
     """
 
-    if show is None:
-        show = ''
-
-    if not mark is None:
-        if mark_color:
-            mark = _helpers.paint_text(mark_color, mark)
-        show = mark + show
-
-    show_get = _start_get_actor_static(True, show)
+    show, show_get = _start_get_show_actor(show, mark, mark_color)
     
     _system.screen.print(show_get, False, learn = False)
 
@@ -360,54 +384,76 @@ def _start(multi_pre : _type_start_multi_pre,
 
     visual = _stage.get(multi_pre_maybe, multi_pre_force, site, info_get, hint_get, body_get)
 
-    def sketch(*args, **kwargs):
-        return visual.get(*args, **kwargs)
-    
-    update = _helpers.chain_functions(info_update, hint_update)
+    # static info and hint have nothing to update
+    update = _helpers.chain_functions(*(updater for updater in (info_update, hint_update) if not updater is _helpers.noop))
+    update_active = not update is _helpers.noop
+
+    widget_mutate = widget.mutate
+    widget_mutate_get_state = widget_mutate.get_state
+    widget_mutate_set_state = widget_mutate.set_state
+    widget_invoke = widget.invoke
+    widget_resolve = widget.resolve
 
     memory = result = None
+
+    warned = False
+    
+    def abort(error):
+        nonlocal warned
+        widget_mutate_set_state(memory)
+        message = error.text
+        if not message is None:
+            lines = _helpers.split_lines(message)
+            _stage.warn(lines)
+            warned = True
+        _system.io.ring()
     
     def invoke(*args, **kwargs):
-        nonlocal memory, result
-        memory = widget.mutate.get_state()
+        nonlocal memory, result, warned
+        memory = widget_mutate_get_state()
         try:
-            try:
-                widget.invoke(*args, **kwargs)
-            except _core.Terminate:
-                result = widget.resolve()
-                raise
-            else:
+            widget_invoke(*args, **kwargs)
+            if warned:
                 _stage.warn(_start_warn_reset_lines)
+                warned = False
+            if update_active:
                 update(widget, *args, **kwargs)
+        except _core.Terminate:
+            try:
+                result = widget_resolve()
+            except Abort as error:
+                abort(error)
+            else:
+                raise
         except _mutates.Error:
             _system.io.ring()
             raise _core.SkipDraw()
         except Abort as error:
-            widget.mutate.set_state(memory)
-            message = error.text
-            if not message is None:
-                lines = _helpers.split_lines(message)
-                _stage.warn(lines)
-            _system.io.ring()
+            abort(error)
 
-    update(widget, None, None) # emulate
+    if update_active:
+        update(widget, None, None) # emulate
 
     try:
-        _system.console.start(sketch, invoke)
+        _system.console.start(visual.get, invoke)
     except BaseException:
         _system.cursor.clear(); raise
 
-    def sketch():
-        if reply is None:
-            lines = []
-        else:
-            value = reply(widget, result)
-            lines = _start_variant_parse(True, value)[0]
-        if multi_aft and not show is None:
-            lines.insert(0, [])
-        lines.append([])
-        return (lines, None)
-    _system.screen.print(sketch, True)
+    if reply is None:
+        reply_lines = []
+    else:
+        reply_value = reply(widget, result)
+        reply_lines = _start_variant_parse(True, reply_value)[0]
+
+    if multi_aft and not show is None:
+        reply_lines.insert(0, [])
+
+    reply_lines.append([])
+
+    def reply_sketch():
+        return (reply_lines, None)
+    
+    _system.screen.print(reply_sketch, True)
 
     return result
 
@@ -489,7 +535,7 @@ class BaseText(Widget, controls = _BaseText_controls):
             def handle_entry(info):
                 raise _core.Terminate()
             
-        callback = _helpers.chain_functions(callback, handle.invoke)
+        callback = handle.invoke if callback is None else _helpers.chain_functions(callback, handle.invoke)
 
         super().__init__(
             mutate, 
@@ -561,6 +607,19 @@ _type_Numeric_init_zfill                 = int
 _type_Numeric_init_invalid_value_message = str
 
 
+_Numeric_int_match   = re.compile(r'\s*[+-]?\d+(?:_\d+)*\s*').fullmatch
+_Numeric_float_match = re.compile(r'\s*[+-]?(?:\d+(?:_\d+)*(?:\.(?:\d+(?:_\d+)*)?)?|\.\d+(?:_\d+)*)(?:[eE][+-]?\d+(?:_\d+)*)?\s*').fullmatch
+
+_Numeric_float_pos_inf = float('inf')
+_Numeric_float_neg_inf = - _Numeric_float_pos_inf
+
+
+@functools.lru_cache(maxsize = 32)
+def _Numeric_get_abort_message(template, name):
+
+    return template.format(name = name)
+
+
 class Numeric(Input):
 
     """
@@ -586,20 +645,18 @@ class Numeric(Input):
 
     @staticmethod
     def _transform_float(abort_message, value):
-        try:
-            value = float(value)
-        except ValueError:
+        if not _Numeric_float_match(value):
             raise Abort(abort_message)
-        if math.isinf(value):
+        value = float(value)
+        if value == _Numeric_float_pos_inf or value == _Numeric_float_neg_inf:
             raise Abort(abort_message)
         return value
     
     @staticmethod
     def _transform_int(abort_message, value):
-        try:
-            value = int(value)
-        except ValueError:
+        if not _Numeric_int_match(value):
             raise Abort(abort_message)
+        value = int(value)
         return value
     
     __slots__ = ('_transform', '_transform_abort_message')
@@ -613,9 +670,7 @@ class Numeric(Input):
                  invalid_value_message: _type_Numeric_init_invalid_value_message = 'invalid {name}',
                  **kwargs):
         
-        super_cls = self.__class__.__mro__[1]
-
-        funnel_leave = _helpers.get_function_arg_safe(super_cls, 'funnel_leave', kwargs, pop = True)
+        funnel_leave = kwargs.pop('funnel_leave', None)
         
         if not value is _helpers.auto:
             value = str(value)
@@ -628,7 +683,7 @@ class Numeric(Input):
             abort_message_space = {'name': 'int'}
 
         self._transform = transform
-        self._transform_abort_message = None if invalid_value_message is None else invalid_value_message.format(**abort_message_space)
+        self._transform_abort_message = None if invalid_value_message is None else _Numeric_get_abort_message(invalid_value_message, **abort_message_space)
 
         funnel_leave_group = []
         funnel_leave_entry = _funnels.text_min_horizontal(_funnels.JustType.end, zfill, '0')
@@ -685,9 +740,7 @@ class Conceal(Input):
                  color: _type_Conceal_init_color = None, 
                  **kwargs):
 
-        super_cls = self.__class__.__mro__[1]
-
-        funnel_leave = _helpers.get_function_arg_safe(super_cls, 'funnel_leave', kwargs, pop = True)
+        funnel_leave = kwargs.pop('funnel_leave', None)
 
         funnel_leave_group = []
         funnel_leave_entry = _funnels.text_replace(rune)
@@ -724,7 +777,7 @@ class AutoSubmitBase(Input):
         - :paramref:`~.Input.validate` - Set to :code:`None`.
     """
 
-    __slots__ = ()
+    __slots__ = ('_insert_state', '_transform')
 
     def __init__(self, 
                  evaluate : _type_AutoSubmitBase_init_evaluate,
@@ -733,9 +786,7 @@ class AutoSubmitBase(Input):
                  transform: _type_AutoSubmitBase_init_transform = None,
                  **kwargs):
         
-        super_cls = self.__class__.__mro__[1]
-
-        callback = _helpers.get_function_arg_safe(super_cls, 'callback', kwargs, pop = True)
+        callback = kwargs.pop('callback', None)
     
         handle = _handle.Handle()
 
@@ -754,13 +805,14 @@ class AutoSubmitBase(Input):
         def _control_submit_enter(info):
             _predicate()
 
-        _state = NotImplemented
+        self._insert_state = NotImplemented
+
+        self._transform = transform
         
         @handle.add
         @_controls.get((_handle.EventType.enter, _core.Event.insert))
         def _control_insert_enter(info):
-            nonlocal _state
-            _state = self._mutate.get_state()
+            self._insert_state = self._mutate.get_state()
 
         @handle.add
         @_controls.get((_handle.EventType.leave, _core.Event.insert))
@@ -768,9 +820,9 @@ class AutoSubmitBase(Input):
             try:
                 _predicate()
             except Abort:
-                self._mutate.set_state(_state); raise
+                self._mutate.set_state(self._insert_state); raise
         
-        callback = _helpers.chain_functions(callback, handle.invoke)
+        callback = handle.invoke if callback is None else _helpers.chain_functions(callback, handle.invoke)
 
         super().__init__(
             *args, 
@@ -780,6 +832,32 @@ class AutoSubmitBase(Input):
         )
             
 
+def _AutoSubmit_make_options(options, transform):
+
+    if not transform is None:
+        options = map(transform, options)
+
+    options = frozenset(options)
+
+    prefixes = frozenset(option[:index] for option in options for index in range(1, len(option) + 1))
+
+    return (options, prefixes)
+
+
+_AutoSubmit_make_options_cached = functools.lru_cache(maxsize = 256)(_AutoSubmit_make_options)
+
+
+def _AutoSubmit_get_options(options, transform):
+
+    # unhashable transforms cannot be keyed, so their sets are built every time
+    try:
+        return _AutoSubmit_make_options_cached(options, transform)
+    except TypeError:
+        pass
+
+    return _AutoSubmit_make_options(options, transform)
+
+
 _type_AutoSubmit_init_options  = typing.List[str]
 _type_AutoSubmit_init_tranform = _type_AutoSubmitBase_init_transform
     
@@ -813,22 +891,14 @@ class AutoSubmit(AutoSubmitBase):
                  transform: _type_AutoSubmit_init_tranform = str.lower,
                  **kwargs):
 
-        if not transform is None:
-            options = map(transform, options)
-
-        options = tuple(set(options))
+        options, prefixes = _AutoSubmit_get_options(tuple(options), transform)
         
         def evaluate(value):
-            if value:
-                for option in options:
-                    if option.startswith(value):
-                        return
-            elif value in options:
+            if value in prefixes or value in options:
                 return
             raise Abort(None)
         
-        def validate(value):
-            return value in options
+        validate = options.__contains__
         
         super().__init__(
             evaluate, 
@@ -876,14 +946,17 @@ class Inquire(AutoSubmit):
         if not default is self._default_mark:
             options[''] = default
 
-        self._options = options
-
         super().__init__(
             options,
             *args,
             **kwargs
         )
 
+        transform = self._transform
+
+        # keyed like the resolved option
+        self._options = options if transform is None else {transform(option): value for option, value in options.items()}
+
     def _resolve(self):
 
         option = super()._resolve()
@@ -906,9 +979,10 @@ def _get_mesh_point(axis, index, default = 0):
     return _helpers.get_axis_point(2, axis, default, index)
 
 
-def _get_mesh_spot(*args, **kwargs):
+@functools.lru_cache(maxsize = 1024)
+def _get_mesh_spot(axis, index, default = 0):
 
-    point = _get_mesh_point(*args, **kwargs)
+    point = _get_mesh_point(axis, index, default)
 
     return tuple(point)
 
@@ -951,7 +1025,7 @@ class BaseMesh(Widget, controls = _BaseMesh_controls):
     :param create:
         Same as :paramref:`.mutates.Mesh.create`.
     :param tiles:
-        Same as :paramref:`.mutates.Mesh.tiles`. Values should be :class:`Widget` instances.
+        Same as :paramref:`.mutates.Mesh.tiles`. Values should be :class:`Widget` instances. A :class:`dict` is used as-is (and mutated in-place), anything else is copied into one.
     :param point:
         Same as :paramref:`.mutates.Mesh.point`.
     :param clean:
@@ -977,7 +1051,7 @@ class BaseMesh(Widget, controls = _BaseMesh_controls):
         Same as :paramref:`.visuals.Mesh.funnel_leave`.
     """
 
-    __slots__ = ('_focus',)
+    __slots__ = ('_focus', '_focusable')
 
     def __init__(self, 
                  tiles       : _type_BaseMesh_init_tiles        = _helpers.auto, 
@@ -999,32 +1073,25 @@ class BaseMesh(Widget, controls = _BaseMesh_controls):
         if tiles is _helpers.auto:
             tiles = ()
 
-        tiles = dict(tiles)
+        if not isinstance(tiles, dict):
+            tiles = dict(tiles)
         
         if point is _helpers.auto:
-            try:
-                point_spot = min(tiles)
-            except ValueError:
-                point = [0, 0]
-            else:
-                point = list(point_spot)
+            point_spot = min(tiles, default = None)
+            point = [0, 0] if point_spot is None else list(point_spot)
 
         mutate = _mutates.Mesh(search, scout, rigid, permit, create, clean, tiles, point)
 
         def visual_get(*args):
-            tiles = {}
-            for vis_spot, cur_spot in mutate.vision.items():
-                try:
-                    tile = mutate.tiles[cur_spot]
-                except KeyError:
-                    continue
-                tiles[vis_spot] = tile.sketch(*args)
+            cur_tiles = mutate.tiles
+            tiles = {vis_spot: cur_tiles[cur_spot].sketch(*args) for vis_spot, cur_spot in mutate.vision.items() if cur_spot in cur_tiles}
             point = mutate.point
             return (tiles, point)
 
         visual = _visuals.Mesh(visual_get, funnel_enter, funnel_leave)
 
         self._focus = focus
+        self._focusable = not callable(focus)
 
         super().__init__(
             mutate, 
@@ -1040,11 +1107,6 @@ class BaseMesh(Widget, controls = _BaseMesh_controls):
 
         return self._focus
 
-    @property
-    def _focusable(self):
-
-        return not callable(self._focus)
-    
     def _invoke_blear(self, *args, **kwargs):
 
         super()._invoke(*args, **kwargs)
@@ -1157,7 +1219,7 @@ class BaseList(BaseMesh, controls = _BaseList_controls):
         
         self._axis = axis
         
-        super_cls = self.__class__.__mro__[1]
+        super_cls = self._super_cls
 
         if tiles is _helpers.auto:
             tiles = ()
@@ -1185,8 +1247,9 @@ class BaseList(BaseMesh, controls = _BaseList_controls):
             funnel_enter_entry = _funnels.mesh_delimit(axis, delimit)
             funnel_enter_group.append(funnel_enter_entry)
 
-        funnel_enter_entry = _funnels.mesh_light(focus_color, evade_color)
-        funnel_enter_group.append(funnel_enter_entry)
+        if not (focus_color is None and evade_color is None):
+            funnel_enter_entry = _funnels.mesh_light(focus_color, evade_color)
+            funnel_enter_group.append(funnel_enter_entry)
 
         if focus_mark is None:
             focus_mark = ''
@@ -1199,13 +1262,17 @@ class BaseList(BaseMesh, controls = _BaseList_controls):
             funnel_enter_group.append(funnel_enter_entry)
 
         if not label is None:
-            def funnel_enter_entry_get(index):
+            label_memos = {}
+            def funnel_enter_entry_get(index, get_mesh_spot = _get_mesh_spot, split_lines = _helpers.split_lines):
                 if not axis:
                     index *= - 1
-                spot = _get_mesh_spot(axis, index)
+                spot = get_mesh_spot(axis, index)
                 tile = self._mutate.tiles.get(spot)
                 value = label(index, tile)
-                lines = _helpers.split_lines(value)
+                memo = label_memos.get(index)
+                if memo is None or not memo[0] == value:
+                    memo = label_memos[index] = (value, split_lines(value))
+                lines = [list(line) for line in memo[1]]
                 return lines
             funnel_enter_entry = _funnels.mesh_head(axis, funnel_enter_entry_get, _funnels.JustType.start)
             funnel_enter_group.append(funnel_enter_entry)
@@ -1214,7 +1281,8 @@ class BaseList(BaseMesh, controls = _BaseList_controls):
             funnel_enter_entry = _funnels.mesh_grid_fill()
             funnel_enter_group.append(funnel_enter_entry)
 
-        funnel_enter = _helpers.chain_functions(*funnel_enter_group, funnel_enter)
+        if funnel_enter_group or not funnel_enter is None:
+            funnel_enter = _helpers.chain_functions(*funnel_enter_group, funnel_enter)
 
         super().__init__(
             *args,
@@ -1277,7 +1345,7 @@ class Select(BaseList):
                  Option : _type_Select_init_Option  = Input,
                  **kwargs):
         
-        super_cls = self.__class__.__mro__[1]
+        super_cls = self._super_cls
         
         axis = _helpers.get_function_arg_safe(super_cls, 'axis', kwargs)
 
@@ -1295,13 +1363,16 @@ class Select(BaseList):
         
         tiles = map(get_tile, options)
 
-        def create(spot, *, __sub = create):
-            if __sub is None:
-                return None
-            value = __sub(spot)
-            if not isinstance(value, Widget):
+        if create is None:
+            # still called by the mesh, yielding nothing
+            create = _helpers.noop
+        else:
+            def create(spot, *, __sub = create):
+                value = __sub(spot)
+                if isinstance(value, Widget):
+                    return value
                 tile = get_tile(value)
-            return tile
+                return tile
 
         super().__init__(
             *args,
@@ -1368,6 +1439,8 @@ class Basket(BaseList):
     |theme| :code:`'widgets.Basket'`.
     """
 
+    __slots__ = ()
+
     @_theme.add('widgets.Basket')
     def __init__(self,
                  *args,
@@ -1379,7 +1452,7 @@ class Basket(BaseList):
                  Stamp        : _type_Basket_init_Stamp         = Select,
                  **kwargs):
         
-        super_cls = self.__class__.__mro__[1]
+        super_cls = self._super_cls
 
         axis = _helpers.get_function_arg_safe(super_cls, 'axis', kwargs)
         axis_refl = int(not axis)
@@ -1403,13 +1476,15 @@ class Basket(BaseList):
         stamp_handle = _handle.Handle()
 
         def _control_function_arrow(forward, info):
-            cur_tile = self._mutate.cur_tile
+            mutate = self._mutate
+            cur_tile = mutate.cur_tile
             cur_spot = cur_tile.mutate.cur_tile.mutate.cur_spot
             cur_mark = cur_spot[axis_refl]
             if not (forward and cur_mark or not forward and not cur_mark):
                 return
-            for oth_spot in self._mutate.vision.values():
-                oth_tile = self._mutate.tiles[oth_spot]
+            tiles = mutate.tiles
+            for oth_spot in mutate.vision.values():
+                oth_tile = tiles[oth_spot]
                 if oth_tile is cur_tile:
                     continue
                 oth_tile.mutate.cur_tile.mutate.point[axis_refl] = cur_mark
@@ -1422,8 +1497,9 @@ class Basket(BaseList):
 
         create_sub = _helpers.get_function_arg_safe(super_cls, 'create', kwargs, pop = True)
         
+        stamp_widget_options = (negative_mark, positive_mark)
+
         def get_widget(index, value):
-            stamp_widget_options = (negative_mark, positive_mark)
             stamp_widget_index = int(index in active)
             stamp_widget = Stamp(
                 options = stamp_widget_options, 
@@ -1440,6 +1516,7 @@ class Basket(BaseList):
             main_widget = BaseList(
                 tiles = main_widget_tiles, 
                 axis = 1,
+                view_max = None,
                 focus = True,
                 focus_color = None,
                 delimit = ' '
@@ -1455,8 +1532,7 @@ class Basket(BaseList):
             widget = get_widget(index, value)
             return widget
         
-        def focus(event):
-            return event in axis_events
+        focus = frozenset(axis_events).__contains__
         
         super().__init__(
             *args,
@@ -1468,13 +1544,10 @@ class Basket(BaseList):
 
     def _produce(self):
 
-        indexes = set()
-        for spot, tile in self._mutate.tiles.items():
-            # row.mutate.stamp.mutate.cur_spot
-            if not tile.mutate.cur_tile.mutate.cur_spot[1]:
-                continue
-            index = spot[self._axis]
-            indexes.add(index)
+        axis = self._axis
+
+        # row.mutate.stamp.mutate.cur_spot
+        indexes = {spot[axis] for spot, tile in self._mutate.tiles.items() if tile.mutate.cur_tile.mutate.cur_spot[1]}
         
         return indexes
 
@@ -1486,11 +1559,11 @@ _type_Count_init_decimal = typing.Union[bool, None]
 _type_Count_init_Numeric = Numeric
     
 
-_Count_focus_events = {
+_Count_focus_events = frozenset({
     _core.Event.insert, _core.Event.delete_left
-}
+})
 
-_Count_focus = lambda event: event in _Count_focus_events
+_Count_focus = _Count_focus_events.__contains__
     
 
 class Count(BaseList):
@@ -1579,13 +1652,13 @@ class Count(BaseList):
         return value_any
     
 
-_DateTime_focus_events = {
+_DateTime_focus_events = frozenset({
     _core.Event.arrow_up, _core.Event.arrow_down,
     _core.Event.insert, _core.Event.delete_left
-}
+})
 
 
-_DateTime_focus = lambda event: event in _DateTime_focus_events
+_DateTime_focus = _DateTime_focus_events.__contains__
 
 
 _DateTime_funnel_enter_arrange_attr_groups = (
@@ -1594,49 +1667,60 @@ _DateTime_funnel_enter_arrange_attr_groups = (
 )
 
 
-def _DateTime_funnel_enter_arrange(axis, attrs, date_delimit, time_delimit, part_delimit, tiles, point):
+_DateTime_funnel_enter_arrange_attr_indexes = {
+    attr: attr_group_index
+    for attr_group_index, attr_group in enumerate(_DateTime_funnel_enter_arrange_attr_groups)
+    for attr in attr_group
+}
 
-    delimits = (date_delimit, time_delimit)
+
+def _DateTime_get_attr_stores(attrs):
 
     stores = ([], [])
 
     for attr in attrs:
-        for attr_group_index, attr_group in enumerate(_DateTime_funnel_enter_arrange_attr_groups):
-            if not attr in attr_group:
-                continue
-            break
-        else:
+        try:
+            attr_group_index = _DateTime_funnel_enter_arrange_attr_indexes[attr]
+        except KeyError:
             raise ValueError(f'invalid attribute: {attr}')
         stores[attr_group_index].append(attr)
 
+    return stores
+
+
+def _DateTime_funnel_enter_arrange(axis, stores, date_delimit, time_delimit, part_delimit, tiles, point):
+
+    delimits = (date_delimit, time_delimit)
+
+    mesh_delimit = _funnels.mesh_delimit.call
+
     index = 0
-    last_tiles = {}
+    last_tiles = None
     roll_tiles = {}
 
     for some_attrs, some_delimit in zip(stores, delimits):
         if not some_attrs:
             continue
         some_tiles = {}
+        # spots are added in increasing index order
+        min_spot = _get_mesh_spot(axis, index)
         for index in range(index, len(some_attrs) + index):
             spot = _get_mesh_spot(axis, index)
             tile = tiles[spot]
             some_tiles[spot] = tile
-        _funnels.mesh_delimit.call(axis, some_delimit, some_tiles, None)
-        try:
-            max_spot = max(last_tiles)
-            min_spot = min(some_tiles)
-        except ValueError:
-            pass
-        else:
-            roll_tiles[max_spot] = last_tiles[max_spot]
+        max_spot = spot
+        mesh_delimit(axis, some_delimit, some_tiles, None)
+        if not last_tiles is None:
+            roll_tiles[last_max_spot] = last_tiles[last_max_spot]
             roll_tiles[min_spot] = some_tiles[min_spot]
         index += 1
         last_tiles = some_tiles
+        last_max_spot = max_spot
 
     if not roll_tiles:
         return
     
-    _funnels.mesh_delimit.call(axis, part_delimit, roll_tiles, None)
+    mesh_delimit(axis, part_delimit, roll_tiles, None)
 
 
 _Datetime_zfills = {
@@ -1698,7 +1782,7 @@ class DateTime(BaseList):
     |theme| :code:`'widgets.DateTime'`.
     """
 
-    __slots__ = ('_datetime', '_datetime_attrs')
+    __slots__ = ('_datetime', '_datetime_attrs', '_datetime_tiles')
 
     @_theme.add('widgets.DateTime')
     def __init__(self,
@@ -1711,7 +1795,7 @@ class DateTime(BaseList):
                  part_delimit: _type_DateTime_init_part_delimit = ' ',
                  **kwargs):
         
-        super_cls = self.__class__.__mro__[1]
+        super_cls = self._super_cls
         
         funnel_enter = _helpers.get_function_arg_safe(super_cls, 'funnel_enter', kwargs, pop = True)
 
@@ -1747,11 +1831,15 @@ class DateTime(BaseList):
             tile = get_tile(attr)
             tiles.append(tile)
 
+        self._datetime_tiles = tuple(tiles)
+
+        attr_stores = _DateTime_get_attr_stores(attrs)
+
         funnel_enter_group = []
 
         funnel_enter_entry = functools.partial(
             _DateTime_funnel_enter_arrange,
-            axis, attrs, date_delimit, time_delimit, part_delimit,
+            axis, attr_stores, date_delimit, time_delimit, part_delimit,
         )
         funnel_enter_group.append(funnel_enter_entry)
 
@@ -1785,12 +1873,8 @@ class DateTime(BaseList):
 
     def _produce(self):
 
-        kwargs = {}
-        for index, name in enumerate(self._datetime_attrs):
-            spot = _get_mesh_spot(self._axis, index)
-            tile = self._mutate.tiles[spot]
-            value = tile.resolve()
-            kwargs[name] = value
+        # tiles are never replaced, so they pair with attrs in order
+        kwargs = {name: tile.resolve() for name, tile in zip(self._datetime_attrs, self._datetime_tiles)}
 
         value = self._convert(kwargs)
 
@@ -1798,6 +1882,18 @@ class DateTime(BaseList):
     
 
 _Form_tile_focus = lambda event: True
+
+
+_Form_field_spot = (0, 0)
+_Form_value_spot = (0, 1)
+
+
+def _Form_get_tile_color(form, index, color):
+
+    if not form._mutate.cur_spot[0] == index:
+        return None
+    
+    return color
     
 
 class Form(BaseList):
@@ -1827,6 +1923,8 @@ class Form(BaseList):
     |theme| :code:`'widgets.Form'`.
     """
 
+    __slots__ = ()
+
     @_theme.add('widgets.Form')
     def __init__(self, 
                  *args, 
@@ -1835,7 +1933,7 @@ class Form(BaseList):
                  delimit = ':',
                  **kwargs):
         
-        super_cls = self.__class__.__mro__[1]
+        super_cls = self._super_cls
         
         form = dict(form)
 
@@ -1845,29 +1943,21 @@ class Form(BaseList):
         focus_color = _helpers.get_function_arg_safe(super_cls, 'focus_color', kwargs, pop = True)
         evade_color = _helpers.get_function_arg_safe(super_cls, 'evade_color', kwargs, pop = True)
                     
-        def get_tile_focus_color(index):
-            def focus_color_get():
-                if not self._mutate.cur_spot[0] == index:
-                    return None
-                return focus_color
-            return focus_color_get
-        
-        def get_tile_evade_color(index):
-            def evade_color_get():
-                if not self._mutate.cur_spot[0] == index:
-                    return None
-                return evade_color
-            return evade_color_get
+        def get_tile_color(index, color):
+            if color is None:
+                return None
+            return functools.partial(_Form_get_tile_color, self, index, color)
         
         top_field_size = max(map(len, form))
 
+        field_funnel_leave_group = []
+        field_funnel_leave_entry = _funnels.text_min_horizontal(_funnels.JustType.end, top_field_size, ' ')
+        field_funnel_leave_group.append(field_funnel_leave_entry)
+        field_funnel_leave_entry = _funnels.text_bloat_horizontal(_funnels.JustType.start, 1, delimit)
+        field_funnel_leave_group.append(field_funnel_leave_entry)
+        field_funnel_leave = _helpers.chain_functions(*field_funnel_leave_group)
+
         def get_tile(index, field, value_widget):
-            field_funnel_leave_group = []
-            field_funnel_leave_entry = _funnels.text_min_horizontal(_funnels.JustType.end, top_field_size, ' ')
-            field_funnel_leave_group.append(field_funnel_leave_entry)
-            field_funnel_leave_entry = _funnels.text_bloat_horizontal(_funnels.JustType.start, 1, delimit)
-            field_funnel_leave_group.append(field_funnel_leave_entry)
-            field_funnel_leave = _helpers.chain_functions(*field_funnel_leave_group)
             field_widget = Field(
                 value = field,
                 funnel_leave = field_funnel_leave
@@ -1878,8 +1968,8 @@ class Form(BaseList):
                 index = 1,
                 tiles = tile_widgets,
                 focus = tile_focus,
-                focus_color = get_tile_evade_color(index),
-                evade_color = get_tile_focus_color(index),
+                focus_color = get_tile_color(index, evade_color),
+                evade_color = get_tile_color(index, focus_color),
                 delimit = ' '
             )
             return tile
@@ -1900,12 +1990,9 @@ class Form(BaseList):
 
     def _produce(self):
 
-        form = {}
-        for tile in self.mutate.tiles.values():
-            field_widget = tile.mutate.tiles[(0, 0)]
-            field = field_widget.resolve()
-            value_widget = tile.mutate.tiles[(0, 1)]
-            value = value_widget.resolve()
-            form[field] = value
+        form = {
+            tile.mutate.tiles[_Form_field_spot].resolve(): tile.mutate.tiles[_Form_value_spot].resolve()
+            for tile in self._mutate.tiles.values()
+        }
 
         return form